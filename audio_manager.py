@@ -28,8 +28,11 @@ class AudioManager:
         self.config = config
         self.phrases = self._load_phrases()
         self.audio_files = []
+        self.audio_names = []
         self.temp_files = []
         self._playback_lock = threading.Lock()
+        self._tts_lock = threading.Lock()
+        self._stopping = threading.Event()
         self.cache_folder = ResourceManager.get_resource_path(os.path.join(audio_folder, "cache"))
         
         os.makedirs(self.cache_folder, exist_ok=True)
@@ -43,6 +46,7 @@ class AudioManager:
             try:
                 gTTS(text="test", lang="en")
                 self._enforce_cache_limit()  # Clean cache on initialization
+                self._start_tts_prefetch()
             except Exception as e:
                 logging.error(f"Failed to initialize gTTS: {e}. Falling back to stock audio.")
                 self.use_tts = False
@@ -50,12 +54,15 @@ class AudioManager:
     
     def set_mode(self, use_tts: bool) -> None:
         """Switch between gTTS and stock audio modes."""
+        entering_tts = use_tts and not self.use_tts
         self.use_tts = use_tts
         if not self.use_tts:
             self._load_stock_audio()
         else:
             self.phrases = self._load_phrases()
             self._enforce_cache_limit()
+            if entering_tts:
+                self._start_tts_prefetch()
     
     def _load_phrases(self) -> List[str]:
         """Load motivational phrases from phrases.json, create file with defaults if missing."""
@@ -86,17 +93,21 @@ class AudioManager:
             self.phrases = phrases
             logging.info("Phrases saved successfully")
             self._enforce_cache_limit()  # Clean cache after updating phrases
+            if self.use_tts:
+                self._start_tts_prefetch()
         except Exception as e:
             logging.error(f"Error saving phrases to phrases.json: {e}")
     
     def _load_stock_audio(self) -> None:
         """Load stock audio files from the stock audio folder."""
         self.audio_files = []
+        self.audio_names = []
         try:
             for file in os.listdir(self.stock_audio_folder):
                 if file.lower().endswith(('.mp3', '.wav')):
                     file_path = ResourceManager.get_resource_path(os.path.join(self.stock_audio_folder, file))
                     self.audio_files.append(file_path)
+                    self.audio_names.append(file)
             if not self.audio_files and not self.use_tts:
                 logging.warning("No stock audio files found. Falling back to TTS.")
                 self.use_tts = True
@@ -190,24 +201,45 @@ class AudioManager:
         except Exception as e:
             logging.error(f"Error enforcing cache limit: {e}")
     
-    def _play_tts_message(self, message: str) -> None:
-        """Play a gTTS message, reusing cached audio if available."""
-        try:
-            audio_file = self._get_cached_audio_path(message)
-            
+    def _ensure_tts_audio(self, message: str) -> str:
+        """Return the cached audio path for a message, generating it with gTTS if missing."""
+        audio_file = self._get_cached_audio_path(message)
+        if os.path.exists(audio_file):
+            return audio_file
+        with self._tts_lock:
             if not os.path.exists(audio_file):
                 logging.debug(f"Generating new TTS audio for phrase: {message}")
-                tts = gTTS(text=message, lang="en")
-                tts.save(audio_file)
-                with self._playback_lock:
-                    self.temp_files.append(audio_file)
+                # Write aside and rename so a concurrent reader never sees a partial file
+                partial_file = audio_file + ".part"
+                gTTS(text=message, lang="en").save(partial_file)
+                os.replace(partial_file, audio_file)
+                # Cache files outlive the session; _enforce_cache_limit handles eviction
                 self._enforce_cache_limit()  # Check cache size after adding new file
+        return audio_file
+    
+    def _start_tts_prefetch(self) -> None:
+        """Render every phrase that is not cached yet on a background thread."""
+        threading.Thread(target=self._prefetch_tts, args=(list(self.phrases),), daemon=True).start()
+    
+    def _prefetch_tts(self, phrases: List[str]) -> None:
+        for message in phrases:
+            try:
+                self._ensure_tts_audio(message)
+            except Exception as e:
+                logging.warning(f"Could not pre-generate TTS audio for '{message}': {e}")
+                return
+    
+    def _play_tts_message(self, message: str) -> None:
+        """Play a gTTS message, reusing cached audio if available."""
+        try:
+            audio_file = self._ensure_tts_audio(message)
             
             with self._playback_lock:
                 pygame.mixer.music.load(audio_file)
                 pygame.mixer.music.play()
-                while pygame.mixer.music.get_busy():
-                    pygame.time.Clock().tick(10)
+                # Hold the lock until the clip ends so the next reminder does not cut this one off
+                while pygame.mixer.music.get_busy() and not self._stopping.is_set():
+                    time.sleep(0.1)
         except Exception as e:
             logging.error(f"Error playing TTS message: {e}")
     
@@ -233,6 +265,7 @@ class AudioManager:
     def cleanup(self) -> None:
         """Clean up audio resources and temporary files."""
         try:
+            self._stopping.set()
             with self._playback_lock:
                 pygame.mixer.music.stop()
                 pygame.mixer.quit()
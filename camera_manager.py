@@ -1,8 +1,17 @@
 import cv2
+import sys
 import logging
 from typing import Tuple, Optional
 import numpy as np
 
+# Native capture backends give lower, more predictable latency than OpenCV's default probe order
+if sys.platform == "win32":
+    CAPTURE_BACKEND = cv2.CAP_DSHOW
+elif sys.platform.startswith("linux"):
+    CAPTURE_BACKEND = cv2.CAP_V4L2
+else:
+    CAPTURE_BACKEND = cv2.CAP_ANY
+
 class CameraManager:
     def __init__(self, device_id: int = 0, flip_horizontal: bool = True):
         self.device_id = device_id
@@ -11,26 +20,33 @@ class CameraManager:
         self.brightness = 0.0  # Range: -100 to 100
         self.contrast = 1.0    # Range: 0.1 to 3.0
         self.gamma = 1.0       # Range: 0.1 to 5.0
+        self._gamma_table = None
 
     def open(self) -> bool:
         logging.debug(f"Attempting to open camera at index {self.device_id}")
-        self.cap = cv2.VideoCapture(self.device_id)
+        self.cap = self._open_capture(self.device_id)
         camera_index = self.device_id
         while not self.cap.isOpened() and camera_index < 10:
             logging.debug(f"Trying camera index {camera_index}...")
             camera_index += 1
-            self.cap = cv2.VideoCapture(camera_index)
+            self.cap = self._open_capture(camera_index)
         if not self.cap.isOpened():
             logging.error("Error: Could not open camera")
-            print("Error: Could not open camera")
             return False
         logging.info(f"Camera found at index {camera_index}")
-        print(f"Camera found at index {camera_index}")
         self._configure_camera()
         return True
 
+    @staticmethod
+    def _open_capture(index: int) -> cv2.VideoCapture:
+        cap = cv2.VideoCapture(index, CAPTURE_BACKEND)
+        if not cap.isOpened() and CAPTURE_BACKEND != cv2.CAP_ANY:
+            cap = cv2.VideoCapture(index)
+        return cap
+
     def _configure_camera(self) -> None:
         logging.debug("Configuring camera settings")
+        self.cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
         self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, 640)
         self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 480)
         self.cap.set(cv2.CAP_PROP_FPS, 15)
@@ -42,7 +58,6 @@ class CameraManager:
             logging.debug("Camera settings applied")
         except Exception as e:
             logging.warning(f"Could not set camera settings: {e}")
-            print("Warning: Could not set camera settings")
 
     def read_frame(self) -> Tuple[bool, Optional[np.ndarray]]:
         if not self.cap or not self.cap.isOpened():
@@ -83,19 +98,23 @@ class CameraManager:
     def set_gamma(self, value: float) -> None:
         """Set gamma value for post-processing."""
         self.gamma = value
+        if value != 1.0:
+            inv_gamma = 1.0 / value
+            self._gamma_table = (((np.arange(256) / 255.0) ** inv_gamma) * 255).astype("uint8")
+        else:
+            self._gamma_table = None
         logging.debug(f"Gamma set to {value}")
 
     def apply_brightness_contrast_gamma(self, frame: Optional[np.ndarray] = None) -> np.ndarray:
         """Apply brightness, contrast, and gamma adjustments to the frame."""
         if frame is None:
             return None
-        # Apply brightness and contrast
-        frame = cv2.convertScaleAbs(frame, alpha=self.contrast, beta=self.brightness)
-        # Apply gamma correction
-        if self.gamma != 1.0:
-            inv_gamma = 1.0 / self.gamma
-            table = np.array([((i / 255.0) ** inv_gamma) * 255 for i in np.arange(0, 256)]).astype("uint8")
-            frame = cv2.LUT(frame, table)
+        # Apply brightness and contrast; identity settings skip the full-frame pass
+        if self.contrast != 1.0 or self.brightness != 0.0:
+            frame = cv2.convertScaleAbs(frame, alpha=self.contrast, beta=self.brightness)
+        # Apply gamma correction with the table built in set_gamma
+        if self._gamma_table is not None:
+            frame = cv2.LUT(frame, self._gamma_table)
         return frame
 
     def adjust_exposure(self, is_overexposed: bool) -> None:
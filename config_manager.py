@@ -31,14 +31,15 @@ class ConfigManager:
             "pull_threshold": 1,
             "max_head_distance": 100,
             "full_head_detection": False,
-            "show_meshes": True
+            "show_meshes": True,
+            "debug_overlay": False
         },
         "audio": {
             "volume": 1.0,
             "language": "en",
             "tts_cache_limit": 50.0  # Default cache limit: 50 MB
         },
-        "camera": {"device": 0, "flip": True}
+        "camera": {"device": 0, "flip": True, "display_fps": 30}
     }
     
     def __init__(self, config_file: str = 'config.json'):
@@ -59,6 +60,7 @@ class ConfigManager:
         detection.setdefault('max_head_distance', self.DEFAULT_CONFIG['detection']['max_head_distance'])
         detection.setdefault('full_head_detection', self.DEFAULT_CONFIG['detection']['full_head_detection'])
         detection.setdefault('show_meshes', self.DEFAULT_CONFIG['detection']['show_meshes'])
+        detection.setdefault('debug_overlay', self.DEFAULT_CONFIG['detection']['debug_overlay'])
 
         try:
             detection['hand_confidence'] = max(0.0, min(1.0, float(detection['hand_confidence'])))
@@ -69,6 +71,7 @@ class ConfigManager:
             detection['max_head_distance'] = max(10, int(detection['max_head_distance']))
             detection['full_head_detection'] = bool(detection['full_head_detection'])
             detection['show_meshes'] = bool(detection['show_meshes'])
+            detection['debug_overlay'] = bool(detection['debug_overlay'])
         except (ValueError, TypeError) as e:
             logging.warning(f"Invalid detection config value: {e}. Reverting to defaults.")
             detection.update(self.DEFAULT_CONFIG['detection'])
@@ -94,9 +97,11 @@ class ConfigManager:
         camera = validated.get('camera', {})
         camera.setdefault('device', self.DEFAULT_CONFIG['camera']['device'])
         camera.setdefault('flip', self.DEFAULT_CONFIG['camera']['flip'])
+        camera.setdefault('display_fps', self.DEFAULT_CONFIG['camera']['display_fps'])
         try:
             camera['device'] = max(0, int(camera['device']))
             camera['flip'] = bool(camera['flip'])
+            camera['display_fps'] = max(1, min(60, int(camera['display_fps'])))
         except (ValueError, TypeError) as e:
             logging.warning(f"Invalid camera config value: {e}. Reverting to defaults.")
             camera.update(self.DEFAULT_CONFIG['camera'])
@@ -5,14 +5,20 @@ from typing import Any, Tuple
 import time
 import logging
 import random
+import collections
+import itertools
+import concurrent.futures
+
+HAND_DRAWING_SPEC = mp.solutions.drawing_utils.DrawingSpec(color=(0, 255, 0), thickness=2, circle_radius=2)
+FACE_DRAWING_SPEC = mp.solutions.drawing_utils.DrawingSpec(color=(0, 0, 255), thickness=1, circle_radius=1)
 
 class HandTracker:
     """Track hand visibility over time."""
     
     def __init__(self, max_history: int = 10):
         self.max_history = max_history
-        self.left_hand_visible = []
-        self.right_hand_visible = []
+        self.left_hand_visible = collections.deque(maxlen=max_history)
+        self.right_hand_visible = collections.deque(maxlen=max_history)
         self.last_visible_time = {"left": 0, "right": 0}
         
     def update(self, left_visible: bool, right_visible: bool) -> None:
@@ -25,19 +31,14 @@ class HandTracker:
             self.last_visible_time["left"] = current_time
         if right_visible:
             self.last_visible_time["right"] = current_time
-            
-        if len(self.left_hand_visible) > self.max_history:
-            self.left_hand_visible.pop(0)
-        if len(self.right_hand_visible) > self.max_history:
-            self.right_hand_visible.pop(0)
     
     def hand_disappeared(self) -> bool:
         """Check if a hand was visible and then disappeared recently."""
         if len(self.left_hand_visible) < 3 or len(self.right_hand_visible) < 3:
             return False
             
-        left_was_visible = any(self.left_hand_visible[:-2])
-        right_was_visible = any(self.right_hand_visible[:-2])
+        left_was_visible = any(itertools.islice(self.left_hand_visible, len(self.left_hand_visible) - 2))
+        right_was_visible = any(itertools.islice(self.right_hand_visible, len(self.right_hand_visible) - 2))
         
         left_now_invisible = not self.left_hand_visible[-1]
         right_now_invisible = not self.right_hand_visible[-1]
@@ -64,6 +65,8 @@ class GestureDetector:
     NOSE_TIP = 4
     EYEBROW_LEFT = 282
     EYEBROW_RIGHT = 52
+    FULL_HEAD_KEYPOINTS = (CHIN, LEFT_CHEEK, RIGHT_CHEEK, JAW_LEFT, JAW_RIGHT,
+                           EYEBROW_LEFT, EYEBROW_RIGHT, NOSE_TIP)
     
     def __init__(self, config):
         self.config = config
@@ -83,13 +86,21 @@ class GestureDetector:
             static_image_mode=False,
             min_tracking_confidence=0.5
         )
-        self.drawing_spec_hands = self.mp_drawing.DrawingSpec(color=(0, 255, 0), thickness=2, circle_radius=2)
-        self.drawing_spec_face = self.mp_drawing.DrawingSpec(color=(0, 0, 255), thickness=1, circle_radius=1)
+        self.drawing_spec_hands = HAND_DRAWING_SPEC
+        self.drawing_spec_face = FACE_DRAWING_SPEC
         self.hand_tracker = HandTracker()
+        # FaceMesh runs here while Hands runs on the caller's thread
+        self._face_executor = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix="face-mesh")
     
-    def process_frame(self, frame: np.ndarray) -> Tuple[Any, Any]:
-        hand_results = self.hands.process(frame)
-        face_results = self.face_mesh.process(frame)
+    def process_frame(self, frame: np.ndarray, face_without_hands: bool = False) -> Tuple[Any, Any]:
+        if face_without_hands:
+            face_future = self._face_executor.submit(self.face_mesh.process, frame)
+            hand_results = self.hands.process(frame)
+            face_results = face_future.result()
+        else:
+            hand_results = self.hands.process(frame)
+            # The face is only needed for detection when a hand is in view
+            face_results = self.face_mesh.process(frame) if hand_results.multi_hand_landmarks else None
         
         # Initialize visibility flags
         left_visible = False
@@ -121,27 +132,37 @@ class GestureDetector:
                     )
             if face_results and face_results.multi_face_landmarks:
                 face_landmarks = face_results.multi_face_landmarks[0]
+                debug_overlay = self.config.detection.get('debug_overlay', False)
+                # Contours only; the 468 per-landmark circles are part of the debug overlay
                 self.mp_drawing.draw_landmarks(
                     frame, face_landmarks, self.mp_face_mesh.FACEMESH_CONTOURS,
-                    self.drawing_spec_face
+                    self.drawing_spec_face if debug_overlay else None
                 )
+                if not debug_overlay:
+                    return frame
                 h, w, _ = frame.shape
-                # Draw eye level line
+                # Debug overlay: eye level line and full-head keypoints
                 right_eye_y = int(face_landmarks.landmark[self.RIGHT_EYE].y * h)
                 left_eye_y = int(face_landmarks.landmark[self.LEFT_EYE].y * h)
                 eye_level = min(right_eye_y, left_eye_y) - int(h * 0.05)
                 cv2.line(frame, (0, eye_level), (w, eye_level), (255, 0, 0), 1)
                 
                 if self.config.detection['full_head_detection']:
-                    for idx in [self.CHIN, self.LEFT_CHEEK, self.RIGHT_CHEEK, 
-                               self.JAW_LEFT, self.JAW_RIGHT, self.EYEBROW_LEFT, 
-                               self.EYEBROW_RIGHT, self.NOSE_TIP]:
-                        x = int(face_landmarks.landmark[idx].x * w)
-                        y = int(face_landmarks.landmark[idx].y * h)
+                    landmarks = face_landmarks.landmark
+                    for idx in self.FULL_HEAD_KEYPOINTS:
+                        x = int(landmarks[idx].x * w)
+                        y = int(landmarks[idx].y * h)
                         cv2.circle(frame, (x, y), 4, (0, 255, 255), -1)
         
         return frame
     
+    @staticmethod
+    def landmarks_to_xyz(landmarks: Any, step: int = 1) -> np.ndarray:
+        """Convert every ``step``-th MediaPipe landmark to an (N, 3) float32 array of normalized x, y, z."""
+        lms = landmarks.landmark[::step]
+        return np.fromiter((v for lm in lms for v in (lm.x, lm.y, lm.z)), dtype=np.float32,
+                           count=3 * len(lms)).reshape(-1, 3)
+    
     @staticmethod
     def get_hand_size(hand_landmarks: Any, frame_width: int, frame_height: int) -> float:
         landmarks_np = np.array([
@@ -163,6 +184,7 @@ class GestureDetector:
         return (np.max(x_coords) - np.min(x_coords)) * (np.max(y_coords) - np.min(y_coords))
     
     def cleanup(self) -> None:
+        self._face_executor.shutdown(wait=True)
         try:
             if self.hands is not None:
                 self.hands.close()
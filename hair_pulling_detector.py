@@ -1,5 +1,6 @@
 import time
 import threading
+import collections
 import logging
 import os
 import numpy as np
@@ -34,7 +35,7 @@ class HairPullingDetector:
         self.state = 'IDLE'
         self.hand_near_head_time = 0
         self.hand_near_head_duration = 0
-        self.last_triggered = 0
+        self.last_triggered = float('-inf')
         self.last_hand_near_head = 0
         
         self.camera_manager = CameraManager(
@@ -53,19 +54,38 @@ class HairPullingDetector:
             stats=self.stats,
             on_quit=self.cleanup,
             on_reset=self.reset_config,
+            on_settings_changed=self._cache_detection_settings,
             audio_manager=self.audio_manager,
             camera_manager=self.camera_manager
         )
         self.ui_manager._on_retry_camera = self._retry_camera
         
         self.fps_history = []
+        self.fps = 0.0
         self.frame_count = 0
-        self.last_fps_update = time.time()
+        self.last_fps_update = time.perf_counter()
+        self._last_ui_push = 0.0
+        self._ui_period = 1.0 / self.config.camera['display_fps']
         self.running = False
         self.detection_thread = None
+        self._capture_thread = None
+        self._capture_stop = threading.Event()
+        # Newest captured frame only; inference always works on the latest image
+        self._captured = collections.deque(maxlen=1)
+        self._rgb_buf = None
+        self._frame_ready = threading.Event()
         
         self.contact_points = []
         self.above_eye_points = []
+        self._cache_detection_settings()
+    
+    def _cache_detection_settings(self) -> None:
+        """Copy detection thresholds into attributes read by the per-frame path."""
+        detection = self.config.detection
+        self._det_cooldown = float(detection['trigger_cooldown'])
+        self._det_duration = float(detection['required_duration'])
+        self._det_max_head_dist = float(detection['max_head_distance'])
+        self._det_full_head = bool(detection['full_head_detection'])
     
     def reset_config(self) -> None:
         config_manager = ConfigManager()
@@ -73,30 +93,10 @@ class HairPullingDetector:
         self.config = config_manager.load_config()  # Reload default config
         
         # Update UIManager's temp_settings and UI elements
-        self.ui_manager.temp_settings.trigger_cooldown = self.config.detection['trigger_cooldown']
-        self.ui_manager.temp_settings.required_duration = self.config.detection['required_duration']
-        self.ui_manager.temp_settings.pull_threshold = self.config.detection['pull_threshold']
-        self.ui_manager.temp_settings.full_head_detection = self.config.detection['full_head_detection']
-        self.ui_manager.temp_settings.show_meshes = self.config.detection['show_meshes']
-        self.ui_manager.temp_settings.tts_cache_limit = self.config.audio['tts_cache_limit']
-        self.ui_manager.temp_settings.max_head_distance = self.config.detection['max_head_distance']
+        self.ui_manager._load_temp_settings(self.config)
         
         # Update UI elements
-        if self.ui_manager.cooldown_scale:
-            self.ui_manager.cooldown_scale.set(self.config.detection['trigger_cooldown'])
-            self.ui_manager.cooldown_var.set(str(self.config.detection['trigger_cooldown']))
-        if self.ui_manager.duration_scale:
-            self.ui_manager.duration_scale.set(self.config.detection['required_duration'])
-            self.ui_manager.duration_var.set(f"{self.config.detection['required_duration']:.1f}")
-        if self.ui_manager.threshold_scale:
-            self.ui_manager.threshold_scale.set(self.config.detection['pull_threshold'])
-            self.ui_manager.threshold_var.set(str(self.config.detection['pull_threshold']))
-        if self.ui_manager.cache_limit_scale:
-            self.ui_manager.cache_limit_scale.set(self.config.audio['tts_cache_limit'])
-            self.ui_manager.cache_limit_var.set(f"{self.config.audio['tts_cache_limit']:.1f}")
-        if self.ui_manager.max_head_distance_scale:
-            self.ui_manager.max_head_distance_scale.set(self.config.detection['max_head_distance'])
-            self.ui_manager.max_head_distance_var.set(str(self.config.detection['max_head_distance']))
+        self.ui_manager._sync_sliders()
         
         if self.ui_manager.full_head_var:
             self.ui_manager.full_head_var.set(self.config.detection['full_head_detection'])
@@ -109,21 +109,33 @@ class HairPullingDetector:
         if self.audio_manager:
             self.audio_manager._enforce_cache_limit()
         
+        self._cache_detection_settings()
         logging.info("Configuration reset to default")
     
-    def _calculate_fps(self) -> float:
-        current_time = time.time()
+    def _calculate_fps(self, current_time: float) -> float:
         time_diff = current_time - self.last_fps_update
         if time_diff > 1.0:
-            fps = self.frame_count / time_diff
-            self.fps_history.append(fps)
+            self.fps_history.append(self.frame_count / time_diff)
             if len(self.fps_history) > 10:
                 self.fps_history.pop(0)
+            self.fps = sum(self.fps_history) / len(self.fps_history)
             self.frame_count = 0
             self.last_fps_update = current_time
-            return sum(self.fps_history) / len(self.fps_history) if self.fps_history else 0
+            return self.fps
         self.frame_count += 1
-        return sum(self.fps_history) / len(self.fps_history) if self.fps_history else 0
+        return self.fps
+    
+    @staticmethod
+    def _first_within(points: np.ndarray, targets: np.ndarray, threshold: float):
+        """Return (point_idx, target_idx, distance) of the first pair closer than threshold, or None."""
+        if len(points) == 0 or len(targets) == 0:
+            return None
+        distances = np.linalg.norm(points[:, None, :] - targets[None, :, :], axis=2)
+        hits = np.argwhere(distances < threshold)
+        if len(hits) == 0:
+            return None
+        i, j = hits[0]
+        return i, j, distances[i, j]
     
     def _hand_near_head(self, hand_results: Any, face_results: Any) -> bool:
         if not hand_results.multi_hand_landmarks or not face_results or not face_results.multi_face_landmarks:
@@ -131,104 +143,66 @@ class HairPullingDetector:
         
         face_landmarks = face_results.multi_face_landmarks[0]
         h, w, _ = self.current_frame.shape
+        scale = np.array([w, h, w], dtype=np.float32)
         
         # Calculate eye level
         right_eye_y = face_landmarks.landmark[self.gesture_detector.RIGHT_EYE].y
         left_eye_y = face_landmarks.landmark[self.gesture_detector.LEFT_EYE].y
         eye_level_normalized = min(right_eye_y, left_eye_y) - 0.05
         eye_level_pixels = int(eye_level_normalized * h)
+        max_head_distance = self._det_max_head_dist
         
         self.contact_points = []
         self.above_eye_points = []
         
-        # Collect face landmarks above eye level for above-eye detection
-        face_points_above_eye_3d = []
-        for i, lm in enumerate(face_landmarks.landmark):
-            if i % 2 == 0 and lm.y * h <= eye_level_pixels:  # Every 2nd landmark above eye level
-                x = lm.x * w
-                y = lm.y * h
-                z = lm.z * w
-                face_points_above_eye_3d.append((x, y, z, i))
+        # Every 2nd face landmark, in pixel space, with the original landmark indices
+        face_indices = np.arange(0, len(face_landmarks.landmark), 2)
+        face_points = GestureDetector.landmarks_to_xyz(face_landmarks, 2) * scale
+        above_eye_mask = face_points[:, 1] <= eye_level_pixels
+        face_points_above_eye = face_points[above_eye_mask]
+        face_indices_above_eye = face_indices[above_eye_mask]
         
         for hand_landmarks in hand_results.multi_hand_landmarks:
-            # Collect hand landmarks above eye level
-            above_eye_landmarks = []
-            for lm in hand_landmarks.landmark:
-                hand_x = lm.x * w
-                hand_y = lm.y * h
-                hand_z = lm.z * w
-                if hand_y <= eye_level_pixels:
-                    above_eye_landmarks.append((hand_x, hand_y, hand_z))
+            hand_points = GestureDetector.landmarks_to_xyz(hand_landmarks) * scale
+            above_eye_landmarks = hand_points[hand_points[:, 1] <= eye_level_pixels]
             
-            if self.config.detection['full_head_detection']:
+            if self._det_full_head:
                 # Full head detection: Check for contact with any face landmark
-                face_points_3d = []
-                for i, lm in enumerate(face_landmarks.landmark):
-                    if i % 2 == 0:  # Use every 2nd landmark for denser coverage
-                        x = lm.x * w
-                        y = lm.y * h
-                        z = lm.z * w
-                        face_points_3d.append((x, y, z, i))
-                
-                for hand_lm in hand_landmarks.landmark:
-                    hand_x = hand_lm.x * w
-                    hand_y = hand_lm.y * h
-                    hand_z = hand_lm.z * w
-                    hand_point_3d = np.array([hand_x, hand_y, hand_z])
-                    
-                    for face_x, face_y, face_z, face_idx in face_points_3d:
-                        face_point_3d = np.array([face_x, face_y, face_z])
-                        distance_3d = np.linalg.norm(hand_point_3d - face_point_3d)
-                        if distance_3d < 20.0:
-                            self.contact_points.append((int(hand_x), int(hand_y)))
-                            logging.debug(f"Contact detected: hand at ({hand_x:.1f}, {hand_y:.1f}, {hand_z:.3f}), "
-                                        f"face landmark {face_idx}, 3D_distance={distance_3d:.2f}, "
-                                        f"contact_threshold=20.0")
-                            return True
-                
-                # Check for above-eye detection
-                if len(above_eye_landmarks) >= 3:
-                    for hand_x, hand_y, hand_z in above_eye_landmarks:
-                        hand_point_3d = np.array([hand_x, hand_y, hand_z])
-                        for face_x, face_y, face_z, face_idx in face_points_above_eye_3d:
-                            face_point_3d = np.array([face_x, face_y, face_z])
-                            distance_3d = np.linalg.norm(hand_point_3d - face_point_3d)
-                            if distance_3d < self.config.detection['max_head_distance']:
-                                self.above_eye_points.append((int(hand_x), int(hand_y)))
-                                logging.debug(f"Above-eye trigger: {len(above_eye_landmarks)} hand landmarks above eye_level={eye_level_pixels}, "
-                                            f"hand at ({hand_x:.1f}, {hand_y:.1f}, {hand_z:.3f}), "
-                                            f"face landmark {face_idx}, 3D_distance={distance_3d:.2f}, "
-                                            f"proximity_threshold={self.config.detection['max_head_distance']}")
-                                return True
-            else:
-                # Non-full head detection: Check only above-eye detection
-                if len(above_eye_landmarks) >= 3:
-                    for hand_x, hand_y, hand_z in above_eye_landmarks:
-                        hand_point_3d = np.array([hand_x, hand_y, hand_z])
-                        for face_x, face_y, face_z, face_idx in face_points_above_eye_3d:
-                            face_point_3d = np.array([face_x, face_y, face_z])
-                            distance_3d = np.linalg.norm(hand_point_3d - face_point_3d)
-                            if distance_3d < self.config.detection['max_head_distance']:
-                                self.above_eye_points.append((int(hand_x), int(hand_y)))
-                                logging.debug(f"Above-eye trigger: {len(above_eye_landmarks)} hand landmarks above eye_level={eye_level_pixels}, "
-                                            f"hand at ({hand_x:.1f}, {hand_y:.1f}, {hand_z:.3f}), "
-                                            f"face landmark {face_idx}, 3D_distance={distance_3d:.2f}, "
-                                            f"proximity_threshold={self.config.detection['max_head_distance']}")
-                                return True
+                hit = self._first_within(hand_points, face_points, 20.0)
+                if hit:
+                    i, j, distance_3d = hit
+                    hand_x, hand_y, hand_z = hand_points[i]
+                    self.contact_points.append((int(hand_x), int(hand_y)))
+                    logging.debug(f"Contact detected: hand at ({hand_x:.1f}, {hand_y:.1f}, {hand_z:.3f}), "
+                                f"face landmark {face_indices[j]}, 3D_distance={distance_3d:.2f}, "
+                                f"contact_threshold=20.0")
+                    return True
+            
+            # Above-eye detection: several hand landmarks above eye level and close to the head
+            if len(above_eye_landmarks) >= 3:
+                hit = self._first_within(above_eye_landmarks, face_points_above_eye, max_head_distance)
+                if hit:
+                    i, j, distance_3d = hit
+                    hand_x, hand_y, hand_z = above_eye_landmarks[i]
+                    self.above_eye_points.append((int(hand_x), int(hand_y)))
+                    logging.debug(f"Above-eye trigger: {len(above_eye_landmarks)} hand landmarks above eye_level={eye_level_pixels}, "
+                                f"hand at ({hand_x:.1f}, {hand_y:.1f}, {hand_z:.3f}), "
+                                f"face landmark {face_indices_above_eye[j]}, 3D_distance={distance_3d:.2f}, "
+                                f"proximity_threshold={max_head_distance}")
+                    return True
         
         return False
     
-    def _check_for_pulling(self, hand_results: Any, face_results: Any) -> None:
+    def _check_for_pulling(self, hand_results: Any, face_results: Any, current_time: float) -> None:
         hand_near = self._hand_near_head(hand_results, face_results)
         hand_detected = hand_near
-        current_time = time.time()
         if hand_detected:
             if self.state == 'IDLE':
                 self.state = 'DETECTING'
                 self.hand_near_head_time = current_time
             self.hand_near_head_duration = current_time - self.hand_near_head_time
             self.last_hand_near_head = current_time
-            if (self.hand_near_head_duration >= self.config.detection['required_duration'] and 
+            if (self.hand_near_head_duration >= self._det_duration and 
                 self.state == 'DETECTING'):
                 self.state = 'PULLING'
         else:
@@ -236,14 +210,14 @@ class HairPullingDetector:
                 self.state = 'IDLE'
                 self.hand_near_head_duration = 0
     
-    def _trigger_alert(self) -> None:
+    def _trigger_alert(self, current_time: float) -> None:
         if self.state == 'PULLING':
-            current_time = time.time()
-            cooldown_passed = (current_time - self.last_triggered) > self.config.detection['trigger_cooldown']
-            if cooldown_passed and self.hand_near_head_duration >= self.config.detection['required_duration']:
+            cooldown_passed = (current_time - self.last_triggered) > self._det_cooldown
+            if cooldown_passed and self.hand_near_head_duration >= self._det_duration:
                 self.last_triggered = current_time
                 self.audio_manager.play_message()
                 self.stats.add_trigger()
+                self.ui_manager.call_soon(self.ui_manager.on_new_trigger)
                 self.state = 'IDLE'
     
     def _retry_camera(self) -> None:
@@ -254,56 +228,101 @@ class HairPullingDetector:
         else:
             self.ui_manager.show_camera_error()
     
+    def _capture_loop(self) -> None:
+        """Read frames as fast as the camera delivers them, keeping only the newest."""
+        read_failed = False
+        while not self._capture_stop.is_set():
+            success, frame = self.camera_manager.read_frame()
+            if not success:
+                # Report once per outage, not on every retry
+                if not read_failed:
+                    read_failed = True
+                    logging.warning("Failed to read frame, retrying...")
+                    self.ui_manager.call_soon(self.ui_manager.show_camera_error)
+                self._capture_stop.wait(0.1)
+                continue
+            read_failed = False
+            self._captured.append(frame)
+            self._frame_ready.set()
+    
     def _detection_loop(self) -> None:
         try:
             if not self.camera_manager.open():
                 logging.error("Failed to open camera")
-                self.ui_manager.show_camera_error()
+                self.ui_manager.call_soon(self.ui_manager.show_camera_error)
                 return
+            self._capture_stop.clear()
+            self._capture_thread = threading.Thread(target=self._capture_loop, daemon=True)
+            self._capture_thread.start()
             while self.running:
-                if not self.running:
-                    break
-
-                success, frame = self.camera_manager.read_frame()
-                if not success:
-                    logging.warning("Failed to read frame, retrying...")
-                    self.ui_manager.show_camera_error()
-                    time.sleep(0.01)
+                if not self._frame_ready.wait(timeout=0.1):
+                    continue
+                self._frame_ready.clear()
+                try:
+                    frame = self._captured.popleft()
+                except IndexError:
                     continue
 
-                self.current_frame = frame.copy()
-                fps = self._calculate_fps()
-                rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+                # One monotonic timestamp per frame, shared by FPS, detection timing and display throttling
+                now = time.perf_counter()
+                self.current_frame = frame
+                fps = self._calculate_fps(now)
+                if self._rgb_buf is None or self._rgb_buf.shape != frame.shape:
+                    self._rgb_buf = np.empty_like(frame)
+                rgb_frame = self._rgb_buf
+                rgb_frame.flags.writeable = True
+                cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=rgb_frame)
+                # Read-only lets MediaPipe wrap the buffer instead of copying it
+                rgb_frame.flags.writeable = False
                 
                 if self.running:
-                    hand_results, face_results = self.gesture_detector.process_frame(rgb_frame)
-                    self._check_for_pulling(hand_results, face_results)
-                    self._trigger_alert()
-                    show_meshes = self.ui_manager.show_meshes_var.get()
+                    # Plain attribute mirrored by the UI; Tk variables must not be read off the Tk thread
+                    show_meshes = self.ui_manager.temp_settings.show_meshes
+                    # Only inference is guarded: a transient MediaPipe failure skips the frame
+                    try:
+                        hand_results, face_results = self.gesture_detector.process_frame(
+                            rgb_frame, face_without_hands=show_meshes)
+                    except (RuntimeError, ValueError) as e:
+                        logging.error(f"Error processing frame: {e}")
+                        continue
+                    self._check_for_pulling(hand_results, face_results, now)
+                    self._trigger_alert(now)
+                    # Drop frames arriving faster than the display rate; detection still runs on every frame
+                    if now - self._last_ui_push < self._ui_period:
+                        continue
+                    self._last_ui_push = now
                     frame_with_landmarks = self.gesture_detector.draw_landmarks(frame, hand_results, face_results, show_meshes)
                     status = self.STATES.get(self.state, 'Monitoring')
                     if self.state == 'DETECTING':
                         status = f"{status} ({self.hand_near_head_duration:.1f}s)"
                     self.ui_manager.update_frame(frame_with_landmarks, fps, status)
-                
-                time.sleep(0.01)
         except Exception as e:
-            logging.error(f"Error in detection loop: {e}")
-            self.ui_manager.show_camera_error()
+            logging.error(f"Error in detection loop: {e}", exc_info=True)
+            self.ui_manager.call_soon(self.ui_manager.show_camera_error)
         finally:
+            self._capture_stop.set()
+            if self._capture_thread:
+                self._capture_thread.join(timeout=1.0)
             self.camera_manager.close()
             logging.info("Detection loop terminated")
     
     def start(self) -> None:
         self.running = True
-        self.detection_thread = threading.Thread(target=self._detection_loop)
-        self.detection_thread.start()
         self.ui_manager.initialize_ui()
+        # Runs once mainloop is up, so the detection thread can always reach Tk through call_soon
+        self.ui_manager.call_soon(self._start_detection)
         self.ui_manager.start()
     
+    def _start_detection(self) -> None:
+        if not self.running:
+            return
+        self.detection_thread = threading.Thread(target=self._detection_loop)
+        self.detection_thread.start()
+    
     def cleanup(self) -> None:
         logging.info("Shutting down application")
         self.running = False
+        self._capture_stop.set()
         
         self.camera_manager.close()
         
@@ -1,21 +1,28 @@
 import logging
+import queue
+from logging.handlers import RotatingFileHandler, QueueHandler, QueueListener
 from config_manager import ConfigManager
 from hair_pulling_detector import HairPullingDetector
 
-def setup_logging():
-    """Set up logging configuration."""
-    logging.basicConfig(
-        level=logging.INFO,
-        format='%(asctime)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.FileHandler('app.log'),
-            logging.StreamHandler()
-        ]
-    )
+def setup_logging() -> QueueListener:
+    """Set up logging configuration; records are written by a background listener thread."""
+    formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+    handlers = [
+        RotatingFileHandler('app.log', maxBytes=1024 * 1024, backupCount=3),
+        logging.StreamHandler()
+    ]
+    for handler in handlers:
+        handler.setFormatter(formatter)
+    
+    log_queue = queue.Queue(-1)
+    logging.basicConfig(level=logging.INFO, handlers=[QueueHandler(log_queue)])
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    return listener
 
 def main():
     """Main entry point for the application."""
-    setup_logging()
+    log_listener = setup_logging()
     logging.info("Starting Trichotillomania-Reminder application")
     
     config_manager = ConfigManager()
@@ -30,6 +37,7 @@ def main():
     finally:
         detector.cleanup()
         logging.info("Application shutdown complete")
+        log_listener.stop()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -1,11 +1,13 @@
 import os
 import sys
+import functools
 from typing import List
 
 class ResourceManager:
     """Manages access to application resources."""
     
     @staticmethod
+    @functools.lru_cache(maxsize=None)
     def get_resource_path(relative_path: str) -> str:
         """Get absolute path to resource, works for dev and for PyInstaller."""
         try:
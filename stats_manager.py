@@ -2,11 +2,6 @@ import json
 import time
 from typing import Dict, List
 from datetime import datetime, timedelta
-import matplotlib
-matplotlib.use("TkAgg")
-from matplotlib.figure import Figure
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-import matplotlib.dates as mdates
 import tkinter as tk
 from tkinter import ttk
 
@@ -84,11 +79,18 @@ class StatsGraphManager:
         self.daily_canvas = None
         self.hourly_figure = None
         self.hourly_canvas = None
+        self._drawn_state = None
         
         self._setup_graphs()
     
     def _setup_graphs(self) -> None:
         """Set up the graph frames and initial figures."""
+        # matplotlib is imported here so loading PullingStats stays cheap
+        import matplotlib
+        matplotlib.use("TkAgg")
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+        
         daily_frame = ttk.LabelFrame(self.parent_frame, text="Daily Triggers Trend")
         daily_frame.pack(fill=tk.BOTH, expand=True, pady=10)
         
@@ -106,12 +108,18 @@ class StatsGraphManager:
         self.update_graphs()
     
     def update_graphs(self) -> None:
-        """Update both graphs with latest data."""
+        """Update both graphs with latest data, skipping the redraw if nothing changed."""
+        state = (len(self.stats.triggers), datetime.now().date())
+        if state == self._drawn_state:
+            return
         self._update_daily_graph()
         self._update_hourly_graph()
+        self._drawn_state = state
     
     def _update_daily_graph(self) -> None:
         """Update the daily trend graph."""
+        import matplotlib.dates as mdates
+        
         self.daily_figure.clear()
         ax = self.daily_figure.add_subplot(111)
         
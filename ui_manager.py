@@ -1,14 +1,16 @@
 import tkinter as tk
 from tkinter import ttk, font, messagebox
 import sv_ttk
-from PIL import Image, ImageTk
-import queue
+import threading
+import time
+import functools
+import concurrent.futures
+import collections
 import logging
-from tkcalendar import Calendar
 from typing import Callable
 import numpy as np
 from config_manager import Config, TempSettings
-from stats_manager import PullingStats, StatsGraphManager
+from stats_manager import PullingStats
 from resource_manager import ResourceManager
 import os
 import shutil
@@ -19,14 +21,47 @@ except ImportError:
     logging.error("tkinterdnd2 not installed. Drag-and-drop functionality will be disabled.")
     TkinterDnD = None
 
+OVERLAY_BACKGROUNDS = {"dark": "#2e2e2e", "light": "#f0f0f0"}
+
+SCALE_DEBOUNCE_MS = 30
+
+# (config section, key) pairs mirrored one-to-one by TempSettings attributes
+SETTING_BINDINGS = (
+    ('detection', 'trigger_cooldown'),
+    ('detection', 'required_duration'),
+    ('detection', 'pull_threshold'),
+    ('detection', 'full_head_detection'),
+    ('detection', 'show_meshes'),
+    ('detection', 'max_head_distance'),
+    ('audio', 'tts_cache_limit'),
+)
+
+# (label, temp_settings attribute, from, to, cast, readout format)
+DETECTION_SLIDERS = (
+    ("Trigger Cooldown (s): Time between alerts", 'trigger_cooldown', 0, 10, int, "{}"),
+    ("Required Duration (s): Detection time", 'required_duration', 0, 5, float, "{:.1f}"),
+    ("Pull Threshold: Sensitivity", 'pull_threshold', 0, 30, int, "{}"),
+    ("Max Head Distance (px): Proximity threshold", 'max_head_distance', 10, 200, int, "{}"),
+)
+
+# (label, CameraManager setter, from, to, initial value)
+CAMERA_SLIDERS = (
+    ("Exposure: Adjusts camera light sensitivity", 'set_exposure', -10, 10, -8.0),
+    ("Brightness: Adjusts image lightness", 'set_brightness', -100, 100, 0.0),
+    ("Contrast: Adjusts image contrast", 'set_contrast', 0.1, 3.0, 1.0),
+    ("Gamma: Adjusts image gamma correction", 'set_gamma', 0.1, 5.0, 1.0),
+)
+
 class UIManager:
     """Manages the application's unified Tkinter UI with scalable elements."""
     
-    def __init__(self, config: Config, stats: PullingStats, on_quit: Callable, on_reset: Callable, audio_manager=None, camera_manager=None):
+    def __init__(self, config: Config, stats: PullingStats, on_quit: Callable, on_reset: Callable,
+                 on_settings_changed: Callable = None, audio_manager=None, camera_manager=None):
         self.config = config
         self.stats = stats
         self.on_quit = on_quit
         self.on_reset = on_reset
+        self.on_settings_changed = on_settings_changed
         self.audio_manager = audio_manager
         self.camera_manager = camera_manager
         self.root = None
@@ -36,6 +71,8 @@ class UIManager:
         self.video_container = None
         self.video_area = None
         self.tabs_frame = None
+        self.notebook = None
+        self._tab_builders = {}
         self.photo = None
         self.temp_settings = TempSettings(
             trigger_cooldown=config.detection['trigger_cooldown'],
@@ -46,17 +83,38 @@ class UIManager:
             tts_cache_limit=config.audio.get('tts_cache_limit', 50.0),
             max_head_distance=config.detection.get('max_head_distance', 100)
         )
-        self.frame_queue = queue.Queue(maxsize=1)
-        self.running = False
+        # Single-slot "latest wins" buffer between the detection thread and the Tk thread
+        self._latest_frame = None
+        self._latest_lock = threading.Lock()
+        self._raw_frames = collections.deque(maxlen=1)
+        self._raw_ready = threading.Event()
+        self._frame_thread = None
+        self._last_status = None
+        self._last_fps_text = None
+        self._fps_next_update = 0.0
+        self._display_scheduled = False
+        self._display_size_key = None
+        self._display_size = None
+        self._resize_dst = None
+        self._trigger_text_cache = {}
+        self._resize_after = None
+        self._last_size = None
+        self._font_sizes = None
+        self._style = None
+        self._running = threading.Event()
         self.video_width = 640
         self.video_height = 480
         self.title_font = None
+        self.under_title_font = None
         self.label_font = None
+        self.overlay_font = None
         self.status_label = None
         self.fps_label = None
         self.depth_label = None
         self.calendar = None
         self.trigger_label = None
+        self.today_stats_label = None
+        self._daily_report_cache = (None, None)
         self.full_head_var = None
         self.show_meshes_var = None
         self.detection_mode_label = None
@@ -68,22 +126,19 @@ class UIManager:
         self.phrases_listbox = None
         self.phrase_entry = None
         self.mode_var = None
-        self.cooldown_scale = None
-        self.duration_scale = None
-        self.threshold_scale = None
-        self.cache_limit_scale = None
-        self.max_head_distance_scale = None
-        self.cooldown_var = None
-        self.duration_var = None
-        self.threshold_var = None
-        self.cache_limit_var = None
-        self.max_head_distance_var = None
+        self._scales = {}
+        self._vars = {}
+        self._pending_after = {}
+        self._io_executor = concurrent.futures.ThreadPoolExecutor(max_workers=4, thread_name_prefix="audio-copy")
+        self._copies_pending = 0
+        self._copies_added = False
+        self._audio_dir = None
         self._exposure_set = False
     
     def initialize_ui(self) -> None:
         self.root = TkinterDnD.Tk() if TkinterDnD else tk.Tk()
+        self.root.withdraw()
         self.root.title("Trichotillomania-Reminder : Hair-Pulling Detection System")
-        self.root.geometry("1280x720")
         self.root.resizable(True, True)
         
         try:
@@ -95,7 +150,15 @@ class UIManager:
         except Exception as e:
             logging.error(f"Error setting window icon: {e}")
         
+        if self.audio_manager:
+            self._audio_dir = ResourceManager.get_resource_path(self.audio_manager.stock_audio_folder)
+        
         sv_ttk.set_theme(self.current_theme)
+        self._style = ttk.Style(self.root)
+        self.title_font = font.Font(family="Segoe UI", size=14, weight="bold")
+        self.under_title_font = font.Font(family="Segoe UI", size=10, weight="bold")
+        self.label_font = font.Font(family="Segoe UI", size=10)
+        self.overlay_font = font.Font(family="Segoe UI", size=12)
         
         main_frame = ttk.Frame(self.root, padding="10")
         main_frame.pack(fill=tk.BOTH, expand=True)
@@ -112,10 +175,7 @@ class UIManager:
         self.placeholder_label = ttk.Label(
             self.video_frame,
             text="Camera not ready yet",
-            foreground="white",
-            background="black",
-            font=("Segoe UI", 12),
-            anchor=tk.CENTER,
+            style="Placeholder.TLabel",
             width=64
         )
         self.placeholder_label.pack()
@@ -123,10 +183,7 @@ class UIManager:
         self.camera_error_label = ttk.Label(
             self.video_frame,
             text="Camera failed to initialize. Please check connection and retry.",
-            foreground="red",
-            background="black",
-            font=("Segoe UI", 12),
-            anchor=tk.CENTER,
+            style="Error.TLabel",
             width=64
         )
         
@@ -139,8 +196,7 @@ class UIManager:
         
         self.video_label = ttk.Label(self.video_frame)
         
-        style = ttk.Style()
-        style.configure("Overlay.TFrame", background="#2e2e2e" if self.current_theme == "dark" else "#f0f0f0")
+        self._configure_styles()
         
         self.video_container.configure(width=self.video_width + 20, height=self.video_height + 30)
         
@@ -149,6 +205,7 @@ class UIManager:
         
         notebook = ttk.Notebook(self.tabs_frame)
         notebook.pack(fill=tk.BOTH, expand=True)
+        self.notebook = notebook
         
         settings_frame = ttk.Frame(notebook, padding="10")
         notebook.add(settings_frame, text="Settings")
@@ -165,9 +222,12 @@ class UIManager:
         phrases_frame = ttk.Frame(notebook, padding="10")
         notebook.add(phrases_frame, text="Phrases")
         
-        self.title_font = font.Font(family="Segoe UI", size=14, weight="bold")
-        self.under_title_font = font.Font(family="Segoe UI", size=10, weight="bold")
-        self.label_font = font.Font(family="Segoe UI", size=10)
+        # Heavy tabs (tkcalendar, matplotlib) are built on first selection
+        self._tab_builders = {
+            str(triggers_frame): functools.partial(self._build_triggers_tab, triggers_frame),
+            str(stats_tab): functools.partial(self._build_stats_tab, stats_tab),
+        }
+        notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
         
         # Settings Tab
         self.title_label = ttk.Label(settings_frame, text="Settings", font=self.title_font)
@@ -177,55 +237,10 @@ class UIManager:
         detection_label = ttk.Label(settings_frame, text="Detection Settings", font=self.under_title_font, style="TLabel")
         detection_label.pack(anchor=tk.W, pady=5)
         
-        self.cooldown_var = tk.StringVar(value=str(self.temp_settings.trigger_cooldown))
-        self.duration_var = tk.StringVar(value=f"{self.temp_settings.required_duration:.1f}")
-        self.threshold_var = tk.StringVar(value=str(self.temp_settings.pull_threshold))
-        self.cache_limit_var = tk.StringVar(value=f"{self.temp_settings.tts_cache_limit:.1f}")
-        self.max_head_distance_var = tk.StringVar(value=str(self.temp_settings.max_head_distance))
-        
-        cooldown_label = ttk.Label(settings_frame, text="Trigger Cooldown (s): Time between alerts", font=self.label_font)
-        cooldown_label.pack(anchor=tk.W)
-        cooldown_frame = ttk.Frame(settings_frame)
-        cooldown_frame.pack(fill=tk.X, pady=5)
-        self.cooldown_scale = ttk.Scale(cooldown_frame, from_=0, to=10, orient=tk.HORIZONTAL,
-                                       command=lambda x: [setattr(self.temp_settings, 'trigger_cooldown', int(float(x))),
-                                                        self.cooldown_var.set(str(int(float(x))))])
-        self.cooldown_scale.set(self.temp_settings.trigger_cooldown)
-        self.cooldown_scale.pack(side=tk.LEFT, fill=tk.X, expand=True)
-        ttk.Label(cooldown_frame, textvariable=self.cooldown_var, width=5, font=self.label_font).pack(side=tk.RIGHT, padx=5)
-        
-        duration_label = ttk.Label(settings_frame, text="Required Duration (s): Detection time", font=self.label_font)
-        duration_label.pack(anchor=tk.W, pady=5)
-        duration_frame = ttk.Frame(settings_frame)
-        duration_frame.pack(fill=tk.X, pady=5)
-        self.duration_scale = ttk.Scale(duration_frame, from_=0, to=5, orient=tk.HORIZONTAL,
-                                       command=lambda x: [setattr(self.temp_settings, 'required_duration', float(x)),
-                                                        self.duration_var.set(f"{float(x):.1f}")])
-        self.duration_scale.set(self.temp_settings.required_duration)
-        self.duration_scale.pack(side=tk.LEFT, fill=tk.X, expand=True)
-        ttk.Label(duration_frame, textvariable=self.duration_var, width=5, font=self.label_font).pack(side=tk.RIGHT, padx=5)
-        
-        threshold_label = ttk.Label(settings_frame, text="Pull Threshold: Sensitivity", font=self.label_font)
-        threshold_label.pack(anchor=tk.W, pady=5)
-        threshold_frame = ttk.Frame(settings_frame)
-        threshold_frame.pack(fill=tk.X, pady=5)
-        self.threshold_scale = ttk.Scale(threshold_frame, from_=0, to=30, orient=tk.HORIZONTAL,
-                                        command=lambda x: [setattr(self.temp_settings, 'pull_threshold', int(float(x))),
-                                                         self.threshold_var.set(str(int(float(x))))])
-        self.threshold_scale.set(self.temp_settings.pull_threshold)
-        self.threshold_scale.pack(side=tk.LEFT, fill=tk.X, expand=True)
-        ttk.Label(threshold_frame, textvariable=self.threshold_var, width=5, font=self.label_font).pack(side=tk.RIGHT, padx=5)
-        
-        max_head_distance_label = ttk.Label(settings_frame, text="Max Head Distance (px): Proximity threshold", font=self.label_font)
-        max_head_distance_label.pack(anchor=tk.W, pady=5)
-        max_head_distance_frame = ttk.Frame(settings_frame)
-        max_head_distance_frame.pack(fill=tk.X, pady=5)
-        self.max_head_distance_scale = ttk.Scale(max_head_distance_frame, from_=10, to=200, orient=tk.HORIZONTAL,
-                                                command=lambda x: [setattr(self.temp_settings, 'max_head_distance', int(float(x))),
-                                                                 self.max_head_distance_var.set(str(int(float(x))))])
-        self.max_head_distance_scale.set(self.temp_settings.max_head_distance)
-        self.max_head_distance_scale.pack(side=tk.LEFT, fill=tk.X, expand=True)
-        ttk.Label(max_head_distance_frame, textvariable=self.max_head_distance_var, width=5, font=self.label_font).pack(side=tk.RIGHT, padx=5)
+        for text, attr, from_, to, cast, fmt in DETECTION_SLIDERS:
+            self._scales[attr] = self._build_slider(
+                settings_frame, text, attr, from_, to, getattr(self.temp_settings, attr), cast, fmt,
+                functools.partial(setattr, self.temp_settings, attr))
         
         checkbox_frame = ttk.Frame(settings_frame)
         checkbox_frame.pack(fill=tk.X, pady=10)
@@ -235,10 +250,7 @@ class UIManager:
             checkbox_frame, 
             text="Full head detection (beard, eyebrows, etc.)", 
             variable=self.full_head_var,
-            command=lambda: [
-                setattr(self.temp_settings, 'full_head_detection', self.full_head_var.get()),
-                self._update_detection_mode_label()
-            ]
+            command=functools.partial(self._on_toggle, 'full_head_detection', self.full_head_var)
         )
         full_head_check.pack(anchor=tk.W, padx=5)
 
@@ -247,10 +259,7 @@ class UIManager:
             checkbox_frame,
             text="Show MediaPipe meshes",
             variable=self.show_meshes_var,
-            command=lambda: [
-                setattr(self.temp_settings, 'show_meshes', self.show_meshes_var.get()),
-                self._update_detection_mode_label()
-            ]
+            command=functools.partial(self._on_toggle, 'show_meshes', self.show_meshes_var)
         )
         show_meshes_check.pack(anchor=tk.W, padx=5)
 
@@ -292,98 +301,10 @@ class UIManager:
         camera_title_label = ttk.Label(camera_settings_frame, text="Camera Settings", font=self.title_font)
         camera_title_label.pack(pady=10)
 
-        exposure_var = tk.StringVar(value="-8.0")
-        brightness_var = tk.StringVar(value="0.0")
-        contrast_var = tk.StringVar(value="1.0")
-        gamma_var = tk.StringVar(value="1.0")
-        
-        exposure_label = ttk.Label(camera_settings_frame, text="Exposure: Adjusts camera light sensitivity", font=self.label_font)
-        exposure_label.pack(anchor=tk.W)
-        exposure_frame = ttk.Frame(camera_settings_frame)
-        exposure_frame.pack(fill=tk.X, pady=5)
-        exposure_scale = ttk.Scale(exposure_frame, from_=-10, to=10, orient=tk.HORIZONTAL,
-                                  command=lambda x: [self.camera_manager.set_exposure(float(x)),
-                                                   exposure_var.set(f"{float(x):.1f}")])
-        exposure_scale.set(-8.0)
-        exposure_scale.pack(side=tk.LEFT, fill=tk.X, expand=True)
-        ttk.Label(exposure_frame, textvariable=exposure_var, width=5, font=self.label_font).pack(side=tk.RIGHT, padx=5)
-        
-        brightness_label = ttk.Label(camera_settings_frame, text="Brightness: Adjusts image lightness", font=self.label_font)
-        brightness_label.pack(anchor=tk.W, pady=5)
-        brightness_frame = ttk.Frame(camera_settings_frame)
-        brightness_frame.pack(fill=tk.X, pady=5)
-        brightness_scale = ttk.Scale(brightness_frame, from_=-100, to=100, orient=tk.HORIZONTAL,
-                                    command=lambda x: [self.camera_manager.set_brightness(float(x)),
-                                                     brightness_var.set(f"{float(x):.1f}")])
-        brightness_scale.set(0.0)
-        brightness_scale.pack(side=tk.LEFT, fill=tk.X, expand=True)
-        ttk.Label(brightness_frame, textvariable=brightness_var, width=5, font=self.label_font).pack(side=tk.RIGHT, padx=5)
-        
-        contrast_label = ttk.Label(camera_settings_frame, text="Contrast: Adjusts image contrast", font=self.label_font)
-        contrast_label.pack(anchor=tk.W, pady=5)
-        contrast_frame = ttk.Frame(camera_settings_frame)
-        contrast_frame.pack(fill=tk.X, pady=5)
-        contrast_scale = ttk.Scale(contrast_frame, from_=0.1, to=3.0, orient=tk.HORIZONTAL,
-                                  command=lambda x: [self.camera_manager.set_contrast(float(x)),
-                                                   contrast_var.set(f"{float(x):.1f}")])
-        contrast_scale.set(1.0)
-        contrast_scale.pack(side=tk.LEFT, fill=tk.X, expand=True)
-        ttk.Label(contrast_frame, textvariable=contrast_var, width=5, font=self.label_font).pack(side=tk.RIGHT, padx=5)
-        
-        gamma_label = ttk.Label(camera_settings_frame, text="Gamma: Adjusts image gamma correction", font=self.label_font)
-        gamma_label.pack(anchor=tk.W, pady=5)
-        gamma_frame = ttk.Frame(camera_settings_frame)
-        gamma_frame.pack(fill=tk.X, pady=5)
-        gamma_scale = ttk.Scale(gamma_frame, from_=0.1, to=5.0, orient=tk.HORIZONTAL,
-                               command=lambda x: [self.camera_manager.set_gamma(float(x)),
-                                                gamma_var.set(f"{float(x):.1f}")])
-        gamma_scale.set(1.0)
-        gamma_scale.pack(side=tk.LEFT, fill=tk.X, expand=True)
-        ttk.Label(gamma_frame, textvariable=gamma_var, width=5, font=self.label_font).pack(side=tk.RIGHT, padx=5)
+        for text, setter, from_, to, value in CAMERA_SLIDERS:
+            self._build_slider(camera_settings_frame, text, setter, from_, to, value, float, "{:.1f}",
+                               functools.partial(self._apply_camera_setting, setter))
 
-        # Triggers Tab
-        triggers_title = ttk.Label(triggers_frame, text="Triggers calendar", font=self.title_font)
-        triggers_title.pack(pady=10)
-        
-        cal_frame = ttk.Frame(triggers_frame)
-        cal_frame.pack(fill=tk.BOTH, expand=True, pady=10)
-        
-        self.calendar = Calendar(
-            cal_frame, 
-            selectmode='day', 
-            date_pattern='yyyy-mm-dd',
-            locale='en_US', 
-            cursor="hand1", 
-            background='white',
-            foreground='black',
-            disabledbackground="#f0f0f0", 
-            bordercolor="#d9d9d9",
-            headersbackground="#f0f0f0", 
-            normalbackground="#ffffff",
-            headersforeground="black",
-            normalforeground="black",
-            selectbackground="black",
-            font=("Segoe UI", 10)
-        )
-        self.calendar.pack(fill=tk.BOTH, expand=True)
-        
-        self.trigger_label = ttk.Label(triggers_frame, text="Select a date to see triggers", font=self.label_font)
-        self.trigger_label.pack(pady=10)
-        
-        today_stats = ttk.Label(triggers_frame, text=self.stats.get_daily_report(), font=self.label_font)
-        today_stats.pack(pady=5)
-        
-        self.calendar.bind("<<CalendarSelected>>", self._update_trigger_display)
-        
-        # Statistics Tab
-        stats_title = ttk.Label(stats_tab, text="Statistics", font=self.title_font)
-        stats_title.pack(pady=10)
-        
-        stats_content_frame = ttk.Frame(stats_tab, padding="10")
-        stats_content_frame.pack(fill=tk.BOTH, expand=True)
-        
-        self.stats_graph_manager = StatsGraphManager(self.stats, stats_content_frame)
-        
         # Phrases Tab
         phrases_title = ttk.Label(phrases_frame, text="Motivational Messages", font=self.title_font)
         phrases_title.pack(pady=10)
@@ -445,16 +366,10 @@ class UIManager:
         audio_label = ttk.Label(phrases_frame, text="Audio Settings", font=self.under_title_font, style="TLabel")
         audio_label.pack(anchor=tk.W, pady=10)
         
-        cache_limit_label = ttk.Label(phrases_frame, text="TTS Cache Limit (MB): Max size for cached audio", font=self.label_font)
-        cache_limit_label.pack(anchor=tk.W, pady=5)
-        cache_limit_frame = ttk.Frame(phrases_frame)
-        cache_limit_frame.pack(fill=tk.X, pady=5)
-        self.cache_limit_scale = ttk.Scale(cache_limit_frame, from_=10, to=1000, orient=tk.HORIZONTAL,
-                                          command=lambda x: [setattr(self.temp_settings, 'tts_cache_limit', float(x)),
-                                                           self.cache_limit_var.set(f"{float(x):.1f}")])
-        self.cache_limit_scale.set(self.temp_settings.tts_cache_limit)
-        self.cache_limit_scale.pack(side=tk.LEFT, fill=tk.X, expand=True)
-        ttk.Label(cache_limit_frame, textvariable=self.cache_limit_var, width=5, font=self.label_font).pack(side=tk.RIGHT, padx=5)
+        self._scales['tts_cache_limit'] = self._build_slider(
+            phrases_frame, "TTS Cache Limit (MB): Max size for cached audio", 'tts_cache_limit', 10, 1000,
+            self.temp_settings.tts_cache_limit, float, "{:.1f}",
+            functools.partial(setattr, self.temp_settings, 'tts_cache_limit'))
         
         self._update_phrases_ui()
         
@@ -462,6 +377,100 @@ class UIManager:
         self.root.bind("<Configure>", self._on_resize)
         self._update_detection_mode_label()
         self._update_layout()
+        self.root.geometry("1280x720")
+        self.root.deiconify()
+    
+    def _on_tab_changed(self, event=None) -> None:
+        """Build a lazily created tab the first time it is selected."""
+        builder = self._tab_builders.pop(self.notebook.select(), None)
+        if builder:
+            builder()
+    
+    def _build_triggers_tab(self, triggers_frame: ttk.Frame) -> None:
+        from tkcalendar import Calendar
+        
+        triggers_title = ttk.Label(triggers_frame, text="Triggers calendar", font=self.title_font)
+        triggers_title.pack(pady=10)
+        
+        cal_frame = ttk.Frame(triggers_frame)
+        cal_frame.pack(fill=tk.BOTH, expand=True, pady=10)
+        
+        self.calendar = Calendar(
+            cal_frame, 
+            selectmode='day', 
+            date_pattern='yyyy-mm-dd',
+            locale='en_US', 
+            cursor="hand1", 
+            background='white',
+            foreground='black',
+            disabledbackground="#f0f0f0", 
+            bordercolor="#d9d9d9",
+            headersbackground="#f0f0f0", 
+            normalbackground="#ffffff",
+            headersforeground="black",
+            normalforeground="black",
+            selectbackground="black",
+            font=("Segoe UI", 10)
+        )
+        self.calendar.pack(fill=tk.BOTH, expand=True)
+        
+        self.trigger_label = ttk.Label(triggers_frame, text="Select a date to see triggers", font=self.label_font)
+        self.trigger_label.pack(pady=10)
+        
+        self.today_stats_label = ttk.Label(triggers_frame, text=self._daily_report(), font=self.label_font)
+        self.today_stats_label.pack(pady=5)
+        
+        self.calendar.bind("<<CalendarSelected>>", self._update_trigger_display)
+    
+    def _build_stats_tab(self, stats_tab: ttk.Frame) -> None:
+        from stats_manager import StatsGraphManager
+        
+        stats_title = ttk.Label(stats_tab, text="Statistics", font=self.title_font)
+        stats_title.pack(pady=10)
+        
+        stats_content_frame = ttk.Frame(stats_tab, padding="10")
+        stats_content_frame.pack(fill=tk.BOTH, expand=True)
+        
+        self.stats_graph_manager = StatsGraphManager(self.stats, stats_content_frame)
+    
+    def _build_slider(self, parent, text: str, key: str, from_: float, to: float, value: float,
+                      cast: Callable, fmt: str, apply: Callable) -> ttk.Scale:
+        """Create a labelled scale whose value is cast, applied and echoed into a readout label."""
+        ttk.Label(parent, text=text, font=self.label_font).pack(anchor=tk.W, pady=5)
+        frame = ttk.Frame(parent)
+        frame.pack(fill=tk.X, pady=5)
+        value_var = tk.DoubleVar(value=value)
+        self._vars[key] = tk.StringVar(value=fmt.format(cast(value)))
+        value_var.trace_add('write', functools.partial(self._schedule_scale, key, value_var, cast, fmt, apply))
+        scale = ttk.Scale(frame, from_=from_, to=to, orient=tk.HORIZONTAL, variable=value_var)
+        scale.pack(side=tk.LEFT, fill=tk.X, expand=True)
+        ttk.Label(frame, textvariable=self._vars[key], width=5, font=self.label_font).pack(side=tk.RIGHT, padx=5)
+        return scale
+    
+    def _schedule_scale(self, key: str, *args) -> None:
+        """Coalesce a drag into one _on_scale call for its trailing value."""
+        pending = self._pending_after.get(key)
+        if pending:
+            self.root.after_cancel(pending)
+        self._pending_after[key] = self.root.after(SCALE_DEBOUNCE_MS, self._on_scale, key, *args)
+    
+    def _on_scale(self, key: str, value_var: tk.DoubleVar, cast: Callable, fmt: str, apply: Callable, *_) -> None:
+        self._pending_after.pop(key, None)
+        value = cast(value_var.get())
+        apply(value)
+        self._vars[key].set(fmt.format(value))
+    
+    def _on_toggle(self, attr: str, var: tk.BooleanVar) -> None:
+        setattr(self.temp_settings, attr, var.get())
+        self._update_detection_mode_label()
+    
+    def _apply_camera_setting(self, setter: str, value: float) -> None:
+        getattr(self.camera_manager, setter)(value)
+    
+    def _sync_sliders(self) -> None:
+        """Move the settings sliders to the current temp_settings; the traces refresh the readouts."""
+        for attr, scale in self._scales.items():
+            scale.set(getattr(self.temp_settings, attr))
     
     def _handle_drop(self, event) -> None:
         if self.mode_var.get() != "audio":
@@ -471,19 +480,35 @@ class UIManager:
         valid_extensions = ('.mp3', '.wav')
         for file_path in files:
             if file_path.lower().endswith(valid_extensions):
-                try:
-                    filename = os.path.basename(file_path)
-                    dest_path = ResourceManager.get_resource_path(os.path.join(self.audio_manager.stock_audio_folder, filename))
-                    shutil.copy(file_path, dest_path)
-                    self.phrases_listbox.insert(tk.END, filename)
-                    self.status_label.config(text=f"Added audio file: {filename}")
-                    self.audio_manager.reload_audio_files()
-                except Exception as e:
-                    logging.error(f"Error copying audio file {file_path}: {e}")
-                    messagebox.showerror("Error", f"Failed to add {filename}: {e}")
+                filename = os.path.basename(file_path)
+                dest_path = os.path.join(self._audio_dir, filename)
+                self._copies_pending += 1
+                future = self._io_executor.submit(shutil.copy, file_path, dest_path)
+                future.add_done_callback(functools.partial(self._copy_finished, filename))
             else:
                 messagebox.showwarning("Invalid File", f"Only MP3 and WAV files are supported: {file_path}")
     
+    def _copy_finished(self, filename: str, future: concurrent.futures.Future) -> None:
+        """Runs on the copy worker; hands the result back to the Tk thread."""
+        self.call_soon(self._on_copy_done, filename, future)
+    
+    def _on_copy_done(self, filename: str, future: concurrent.futures.Future) -> None:
+        self._copies_pending -= 1
+        error = future.exception()
+        if error:
+            logging.error(f"Error copying audio file {filename}: {error}")
+            messagebox.showerror("Error", f"Failed to add {filename}: {error}")
+        else:
+            self._copies_added = True
+            self.status_label.config(text=f"Added audio file: {filename}")
+        # Rescan the folder once, after the last copy of the drop lands
+        if self._copies_pending == 0 and self._copies_added:
+            self._copies_added = False
+            self.audio_manager.reload_audio_files()
+            if self.mode_var.get() == "audio":
+                self.phrases_listbox.delete(0, tk.END)
+                self.phrases_listbox.insert(tk.END, *self.audio_manager.audio_names)
+    
     def _update_phrases_ui(self) -> None:
         mode = self.mode_var.get()
         self.phrases_listbox.delete(0, tk.END)
@@ -492,13 +517,11 @@ class UIManager:
         if mode == "text":
             self.phrase_entry.config(state='normal')
             if self.audio_manager:
-                for phrase in self.audio_manager.phrases:
-                    self.phrases_listbox.insert(tk.END, phrase)
+                self.phrases_listbox.insert(tk.END, *self.audio_manager.phrases)
         else:
             self.phrase_entry.config(state='disabled')
             if self.audio_manager:
-                for audio_file in self.audio_manager.audio_files:
-                    self.phrases_listbox.insert(tk.END, os.path.basename(audio_file))
+                self.phrases_listbox.insert(tk.END, *self.audio_manager.audio_names)
         self.status_label.config(text=f"Switched to {'Text Phrases' if mode == 'text' else 'Audio Files'} mode")
     
     def _add_phrase(self) -> None:
@@ -541,7 +564,7 @@ class UIManager:
         
         if self.mode_var.get() == "audio":
             try:
-                file_path = ResourceManager.get_resource_path(os.path.join(self.audio_manager.stock_audio_folder, item))
+                file_path = os.path.join(self._audio_dir, item)
                 if os.path.exists(file_path):
                     os.remove(file_path)
                     self.audio_manager.reload_audio_files()
@@ -574,10 +597,17 @@ class UIManager:
     def _toggle_theme(self) -> None:
         self.current_theme = "light" if self.current_theme == "dark" else "dark"
         sv_ttk.set_theme(self.current_theme)
-        style = ttk.Style()
-        style.configure("Overlay.TFrame", background="#2e2e2e" if self.current_theme == "dark" else "#f0f0f0")
+        self._configure_styles()
         self.status_label.config(text=f"Switched to {self.current_theme} mode")
     
+    def _configure_styles(self) -> None:
+        """ttk style options are per theme, so these are reapplied after every theme switch."""
+        self._style.configure("Overlay.TFrame", background=OVERLAY_BACKGROUNDS[self.current_theme])
+        self._style.configure("Placeholder.TLabel", foreground="white", background="black",
+                              font=self.overlay_font, anchor=tk.CENTER)
+        self._style.configure("Error.TLabel", foreground="red", background="black",
+                              font=self.overlay_font, anchor=tk.CENTER)
+    
     def _update_detection_mode_label(self) -> None:
         mode_text = "Detection Mode: "
         if self.full_head_var.get():
@@ -588,45 +618,22 @@ class UIManager:
         self.detection_mode_label.config(text=mode_text)
     
     def _save_settings(self) -> None:
-        self.config.detection['trigger_cooldown'] = self.temp_settings.trigger_cooldown
-        self.config.detection['required_duration'] = self.temp_settings.required_duration
-        self.config.detection['pull_threshold'] = self.temp_settings.pull_threshold
-        self.config.detection['full_head_detection'] = self.full_head_var.get()
-        self.config.detection['show_meshes'] = self.show_meshes_var.get()
-        self.config.detection['max_head_distance'] = self.temp_settings.max_head_distance
-        self.config.audio['tts_cache_limit'] = self.temp_settings.tts_cache_limit
+        for section, key in SETTING_BINDINGS:
+            getattr(self.config, section)[key] = getattr(self.temp_settings, key)
         if self.audio_manager:
             self.audio_manager._enforce_cache_limit()
+        if self.on_settings_changed:
+            self.on_settings_changed()
         self.status_label.config(text="Settings saved")
     
     def _reset_settings(self) -> None:
         self.on_reset()
         
         # Update temp_settings with default values from config
-        self.temp_settings.trigger_cooldown = self.config.detection['trigger_cooldown']
-        self.temp_settings.required_duration = self.config.detection['required_duration']
-        self.temp_settings.pull_threshold = self.config.detection['pull_threshold']
-        self.temp_settings.full_head_detection = self.config.detection['full_head_detection']
-        self.temp_settings.show_meshes = self.config.detection['show_meshes']
-        self.temp_settings.max_head_distance = self.config.detection['max_head_distance']
-        self.temp_settings.tts_cache_limit = self.config.audio['tts_cache_limit']
+        self._load_temp_settings(self.config)
         
         # Update sliders
-        if self.cooldown_scale:
-            self.cooldown_scale.set(self.temp_settings.trigger_cooldown)
-            self.cooldown_var.set(str(self.temp_settings.trigger_cooldown))
-        if self.duration_scale:
-            self.duration_scale.set(self.temp_settings.required_duration)
-            self.duration_var.set(f"{self.temp_settings.required_duration:.1f}")
-        if self.threshold_scale:
-            self.threshold_scale.set(self.temp_settings.pull_threshold)
-            self.threshold_var.set(str(self.temp_settings.pull_threshold))
-        if self.cache_limit_scale:
-            self.cache_limit_scale.set(self.temp_settings.tts_cache_limit)
-            self.cache_limit_var.set(f"{self.temp_settings.tts_cache_limit:.1f}")
-        if self.max_head_distance_scale:
-            self.max_head_distance_scale.set(self.temp_settings.max_head_distance)
-            self.max_head_distance_var.set(str(self.temp_settings.max_head_distance))
+        self._sync_sliders()
         
         # Update checkboxes
         if self.full_head_var:
@@ -643,12 +650,39 @@ class UIManager:
         
         self.status_label.config(text="Settings reset to default")
     
+    def _load_temp_settings(self, config: Config) -> None:
+        for section, key in SETTING_BINDINGS:
+            setattr(self.temp_settings, key, getattr(config, section)[key])
+    
     def _update_trigger_display(self, event=None) -> None:
+        if not self.calendar:
+            return
         selected_date = self.calendar.get_date()
-        if selected_date in self.stats.daily_stats:
-            self.trigger_label.config(text=f"Triggers on {selected_date}: {self.stats.daily_stats[selected_date]}")
-        else:
-            self.trigger_label.config(text=f"No triggers recorded for {selected_date}")
+        text = self._trigger_text_cache.get(selected_date)
+        if text is None:
+            if selected_date in self.stats.daily_stats:
+                text = f"Triggers on {selected_date}: {self.stats.daily_stats[selected_date]}"
+            else:
+                text = f"No triggers recorded for {selected_date}"
+            self._trigger_text_cache[selected_date] = text
+        self.trigger_label.config(text=text)
+    
+    def on_new_trigger(self) -> None:
+        """Invalidate cached trigger texts and refresh the display after a trigger is recorded."""
+        self._trigger_text_cache.clear()
+        self._daily_report_cache = (None, None)
+        self._update_trigger_display()
+        if self.today_stats_label:
+            self.today_stats_label.config(text=self._daily_report())
+    
+    def _daily_report(self) -> str:
+        """Today's trigger report, rebuilt only when the date changes or a trigger is recorded."""
+        today = time.strftime("%Y-%m-%d")
+        cached_day, report = self._daily_report_cache
+        if cached_day != today:
+            report = self.stats.get_daily_report()
+            self._daily_report_cache = (today, report)
+        return report
     
     def _update_layout(self) -> None:
         window_width = self.root.winfo_width()
@@ -656,28 +690,46 @@ class UIManager:
         self.tabs_frame.configure(width=tabs_width)
     
     def _on_resize(self, event=None) -> None:
-        if event.widget == self.root:
-            self._perform_resize(event)
-    
-    def _perform_resize(self, event=None) -> None:
-        if event.widget == self.root:
-            width, height = self.root.winfo_width(), self.root.winfo_height()
-            title_size = max(int(height / 60), 12)
-            label_size = max(int(height / 80), 10)
-            self.title_font.config(size=title_size)
-            self.label_font.config(size=label_size)
-            self.video_width = max(int(width * 0.6), 320)
-            self.video_height = max(int(height * 0.8), 240)
-            if not self.camera_initialized:
-                self.placeholder_label.configure(width=self.video_width // 10)
-            if self.photo:
-                container_width = self.photo.width() + 20
-                container_height = self.photo.height() + 30
-            else:
-                container_width = self.video_width + 20
-                container_height = self.video_height + 30
-            self.video_container.configure(width=container_width, height=container_height)
-            self._update_layout()
+        if event.widget is not self.root:
+            return
+        # Only the trailing event of a drag-resize gets laid out
+        if self._resize_after:
+            self.root.after_cancel(self._resize_after)
+        self._resize_after = self.root.after(50, self._perform_resize, event.width, event.height)
+    
+    def _perform_resize(self, width: int, height: int) -> None:
+        self._resize_after = None
+        if (width, height) == self._last_size:
+            return
+        self._last_size = (width, height)
+        font_sizes = (max(int(height / 60), 12), max(int(height / 80), 10))
+        if font_sizes != self._font_sizes:
+            self._font_sizes = font_sizes
+            self.title_font.config(size=font_sizes[0])
+            self.label_font.config(size=font_sizes[1])
+        self.video_width = max(int(width * 0.6), 320)
+        self.video_height = max(int(height * 0.8), 240)
+        if not self.camera_initialized:
+            self.placeholder_label.configure(width=self.video_width // 10)
+        if self.photo:
+            container_width = self.photo.width() + 20
+            container_height = self.photo.height() + 30
+        else:
+            container_width = self.video_width + 20
+            container_height = self.video_height + 30
+        self.video_container.configure(width=container_width, height=container_height)
+        self._update_layout()
+    
+    def call_soon(self, callback: Callable, *args) -> None:
+        """Schedule a callback on the Tk thread; safe to call from worker threads."""
+        if not self.root:
+            logging.warning(f"UI not initialized, dropping {getattr(callback, '__name__', callback)}")
+            return
+        try:
+            self.root.after(0, callback, *args)
+        except (RuntimeError, tk.TclError) as e:
+            # Tk is already torn down during shutdown
+            logging.debug(f"Could not schedule {getattr(callback, '__name__', callback)}: {e}")
     
     def show_camera_error(self) -> None:
         self.placeholder_label.pack_forget()
@@ -685,6 +737,7 @@ class UIManager:
         self.camera_error_label.pack(pady=5)
         self.retry_button.pack(pady=5)
         self.status_label.config(text="Camera initialization failed")
+        self._last_status = None
     
     def _retry_camera(self) -> None:
         self.camera_error_label.pack_forget()
@@ -695,59 +748,130 @@ class UIManager:
             self._on_retry_camera()
     
     def update_frame(self, frame: np.ndarray, fps: float, status: str) -> None:
-        if self.frame_queue.full():
+        """Hand a BGR frame to the display worker, replacing any frame it has not picked up yet."""
+        self._raw_frames.append((frame, fps, status))
+        self._raw_ready.set()
+    
+    def _frame_worker(self) -> None:
+        """Convert queued frames for display off both the detection and Tk threads."""
+        while self._running.is_set():
+            if not self._raw_ready.wait(timeout=0.1):
+                continue
+            self._raw_ready.clear()
             try:
-                self.frame_queue.get_nowait()
-            except queue.Empty:
-                pass
+                item = self._raw_frames.popleft()
+            except IndexError:
+                continue
+            self._render_frame(*item)
+    
+    def _render_frame(self, frame: np.ndarray, fps: float, status: str) -> None:
         try:
-            frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
             height, width = frame.shape[:2]
-            ratio = min(self.video_width / width, self.video_height / height)
-            new_size = (int(width * ratio), int(height * ratio))
-            resized_frame = cv2.resize(frame, new_size)
-            pil_img = Image.fromarray(resized_frame)
-            photo = ImageTk.PhotoImage(image=pil_img)
-            self.frame_queue.put((photo, fps, status))
-            if self.stats_graph_manager:
-                self.stats_graph_manager.update_graphs()
-            if not self.camera_initialized and photo:
-                self.camera_initialized = True
-                self.placeholder_label.pack_forget()
-                self.camera_error_label.pack_forget()
-                self.retry_button.pack_forget()
-                self.video_label.pack()
-                self.video_container.configure(width=photo.width() + 20, height=photo.height() + 30)
-                if not self._exposure_set:
-                    try:
-                        self.camera_manager.set_exposure(-8.0)
-                        self._exposure_set = True
-                        logging.info("Exposure set to -8.0 after camera initialization")
-                    except Exception as e:
-                        logging.error(f"Failed to set exposure after initialization: {e}")
-        except Exception as e:
+            new_size = self._get_display_size(width, height)
+            if new_size == (width, height):
+                resized_frame = frame
+            else:
+                # INTER_AREA for downscales, INTER_NEAREST is plenty for enlarging a preview
+                interpolation = cv2.INTER_AREA if new_size[0] < width else cv2.INTER_NEAREST
+                dst_shape = (new_size[1], new_size[0]) + frame.shape[2:]
+                if self._resize_dst is None or self._resize_dst.shape != dst_shape or self._resize_dst.dtype != frame.dtype:
+                    self._resize_dst = np.empty(dst_shape, dtype=frame.dtype)
+                resized_frame = cv2.resize(frame, new_size, dst=self._resize_dst, interpolation=interpolation)
+            if resized_frame.dtype != np.uint8:
+                resized_frame = np.clip(resized_frame, 0, 255).astype(np.uint8)
+            # BGR -> RGB as a strided view; tobytes() writes it out in C order in a single copy.
+            # Tk's photo image parses binary PPM natively, so no PIL round-trip is needed
+            ppm_data = b'P6\n%d %d\n255\n' % new_size + resized_frame[..., ::-1].tobytes()
+            with self._latest_lock:
+                self._latest_frame = (new_size, ppm_data, fps, status)
+                schedule = not self._display_scheduled
+                self._display_scheduled = True
+            # At most one pending display callback; it always picks up the newest frame
+            if schedule and self._running.is_set():
+                self.root.after_idle(self.process_frame_queue)
+        except (cv2.error, ValueError) as e:
             logging.error(f"Error updating frame: {e}")
+        except Exception as e:
+            logging.error(f"Unexpected error updating frame: {e}", exc_info=True)
+    
+    def _get_display_size(self, width: int, height: int):
+        """Scaled frame size for the current video area, recomputed only when either size changes."""
+        key = (width, height, self.video_width, self.video_height)
+        if key != self._display_size_key:
+            ratio = min(self.video_width / width, self.video_height / height)
+            self._display_size = (int(width * ratio), int(height * ratio))
+            self._display_size_key = key
+        return self._display_size
+    
+    def _show_video(self, size) -> None:
+        """Swap the placeholder for the video label once the first frame arrives."""
+        self.camera_initialized = True
+        self.placeholder_label.pack_forget()
+        self.camera_error_label.pack_forget()
+        self.retry_button.pack_forget()
+        self.video_label.pack()
+        self.video_container.configure(width=size[0] + 20, height=size[1] + 30)
+        if not self._exposure_set:
+            try:
+                self.camera_manager.set_exposure(-8.0)
+                self._exposure_set = True
+                logging.info("Exposure set to -8.0 after camera initialization")
+            except Exception as e:
+                logging.error(f"Failed to set exposure after initialization: {e}")
     
     def process_frame_queue(self) -> None:
+        """Display the newest converted frame; scheduled on the Tk thread by the frame worker."""
         try:
-            if not self.frame_queue.empty():
-                photo, fps, status = self.frame_queue.get_nowait()
-                self.photo = photo
-                self.video_label.config(image=self.photo)
-                self.status_label.config(text=status)
-                self.fps_label.config(text=f"FPS: {fps:.1f}")
-        except Exception as e:
+            with self._latest_lock:
+                latest, self._latest_frame = self._latest_frame, None
+                self._display_scheduled = False
+            if latest is not None:
+                size, ppm_data, fps, status = latest
+                if not self.camera_initialized:
+                    self._show_video(size)
+                # Reuse one PhotoImage; only reallocate when the display size changes
+                if self.photo is None or (self.photo.width(), self.photo.height()) != size:
+                    self.photo = tk.PhotoImage(width=size[0], height=size[1], data=ppm_data, format='PPM')
+                    self.video_label.config(image=self.photo)
+                else:
+                    self.photo.configure(data=ppm_data, format='PPM')
+                # Skip no-op label updates; the FPS readout only refreshes twice a second
+                if status != self._last_status:
+                    self.status_label.config(text=status)
+                    self._last_status = status
+                now = time.monotonic()
+                if now >= self._fps_next_update:
+                    self._fps_next_update = now + 0.5
+                    fps_text = f"FPS: {fps:.1f}"
+                    if fps_text != self._last_fps_text:
+                        self.fps_label.config(text=fps_text)
+                        self._last_fps_text = fps_text
+        except tk.TclError as e:
             logging.error(f"Error processing frame queue: {e}")
-        if self.running:
-            self.root.after(15, self.process_frame_queue)
+        except Exception as e:
+            logging.error(f"Unexpected error processing frame queue: {e}", exc_info=True)
+    
+    def _tick_graphs(self) -> None:
+        """Redraw the statistics graphs once a second, independent of the frame rate."""
+        if self.stats_graph_manager:
+            try:
+                self.stats_graph_manager.update_graphs()
+            except Exception as e:
+                logging.error(f"Error updating graphs: {e}")
+        if self._running.is_set():
+            self.root.after(1000, self._tick_graphs)
     
     def start(self) -> None:
-        self.running = True
-        self.process_frame_queue()
+        self._running.set()
+        self._frame_thread = threading.Thread(target=self._frame_worker, daemon=True)
+        self._frame_thread.start()
+        self.root.after(1000, self._tick_graphs)
         self.root.mainloop()
     
     def close(self) -> None:
-        self.running = False
+        self._running.clear()
+        self._raw_ready.set()
+        self._io_executor.shutdown(wait=False)
         self.on_quit()
         try:
             self.root.destroy()